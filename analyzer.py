@@ -6,20 +6,22 @@ Analyzes log files and uses AI to find root causes automatically
 
 import argparse
 import json
+import mmap
 import os
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
-    from rich.syntax import Syntax
-    from rich.progress import track
 except ImportError:
     print("Installing required packages...")
     os.system("pip install rich requests pandas")
@@ -27,12 +29,109 @@ except ImportError:
     from rich.table import Table
     from rich.panel import Panel
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    # AIAnalyzer falls back to heuristic analysis without it
+    requests = None
+
+try:
+    # google-re2 matches in linear time
+    import re2
+    _compile_line = re2.compile
+except ImportError:
+    # RE2's \w, \d and \s are ASCII-only; re.ASCII makes both backends parse alike
+    _compile_line = partial(re.compile, flags=re.ASCII)
+
+# console.print runs rich's markup parser and renderer on every call. Keep it
+# out of the per-line parse/analyze loops and report once per phase instead.
 console = Console()
 
+# Common log patterns. _parse_line picks one candidate format from the first
+# character of the line and falls back to the bracket/generic patterns, so
+# most lines cost a single match() call.
+# ISO timestamp: 2024-01-15 14:23:15 ERROR: message
+_ISO_LINE = _compile_line(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+(\w{1,32}):\s+(.+)')
+# Python logging: [2024-01-15 14:23:15] ERROR message
+_PYLOG_LINE = _compile_line(r'\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\]\s+(\w{1,32})\s+(.+)')
+# Syslog: Jan 15 14:23:15 ERROR: message
+_SYSLOG_LINE = _compile_line(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\w{1,32}):\s+(.+)')
+# Bracketed level: [ERROR] message
+_BRACKET_LINE = _compile_line(r'\[(\w{1,32})\]\s+(.+)')
+# Generic: ERROR: message or [ERROR]: message
+_GENERIC_LINE = _compile_line(r'\[?(\w{1,32})\]?:\s+(.+)')
+
+# Shortest line any pattern can match ("X: y")
+_MIN_LINE_LENGTH = 4
+
+_ERROR_LEVELS = frozenset(('ERROR', 'CRITICAL', 'FATAL'))
+
+# Errors at most this many seconds apart belong to the same cascade
+_CASCADE_GAP_SECONDS = 5
+_CASCADE_MIN_ERRORS = 3
+
+# Log files are read in large binary chunks and split into lines in memory
+_READ_CHUNK_SIZE = 256 * 1024
+# Beyond this many bytes the file is memory-mapped instead of read
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Distinct raw error messages remembered per analyze() call; past this the
+# messages are mostly unique and memoizing them only costs memory
+_NORMALIZE_MEMO_SIZE = 4096
+
+# C-level accessor so level counting over a list needs no Python loop
+_entry_level = attrgetter('level')
+
+# Hex IDs first so a long hex run is not split into numbers
+_NORMALIZE_TOKEN = re.compile(r'\b[0-9a-f]{8,}\b|\b\d+\b')
+
+
+def _normalize_token(match) -> str:
+    """Replacement for _NORMALIZE_TOKEN: pure numbers become N, hex IDs become ID"""
+    token = match.group()
+    return 'N' if token.isdigit() else 'ID'
+
+
+# Layout of the heuristic report AIAnalyzer returns when no AI backend is available
+_FALLBACK_TEMPLATE = "ROOT CAUSE: {root}\n\nFIXES:\n{fixes}\n\nPREVENTION: {prevention}"
+
+# (keywords, root cause, fixes, prevention), checked in order against the
+# lower-cased top error; the first rule with a matching keyword wins
+_FALLBACK_RULES = (
+    (('connection', 'refused'),
+     "Network connectivity or service connection failure",
+     ("Check network connectivity between services",
+      "Verify target service is running and accepting connections",
+      "Review firewall rules and security groups"),
+     "Implement health checks, connection pooling, and retry logic with exponential backoff"),
+    (('timeout',),
+     "Service timeout - operations taking too long",
+     ("Increase timeout values in configuration",
+      "Optimize slow database queries or API calls",
+      "Add caching layer for frequently accessed data"),
+     "Set up performance monitoring and alerts for slow operations"),
+    (('memory', 'oom'),
+     "Memory exhaustion - possible memory leak",
+     ("Increase memory allocation for the service",
+      "Review code for memory leaks",
+      "Restart affected services"),
+     "Add memory monitoring, implement proper cleanup, and consider memory profiling"),
+    (('permission', 'denied'),
+     "Permission or authentication failure",
+     ("Review and update service permissions",
+      "Verify credentials are correct and not expired",
+      "Check IAM roles and policies"),
+     "Implement proper credential rotation and access control management"),
+)
+
 
 class LogEntry:
     """Represents a single log entry"""
 
+    __slots__ = ('timestamp', 'level', 'message', 'raw')
+
     def __init__(self, timestamp: str, level: str, message: str, raw: str):
         self.timestamp = timestamp
         self.level = level
@@ -43,72 +142,218 @@ class LogEntry:
         return f"LogEntry({self.timestamp}, {self.level}, {self.message[:50]}...)"
 
 
+@lru_cache(maxsize=65536)
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO or syslog timestamp; None if it is missing or unrecognised"""
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        pass
+
+    try:
+        # Syslog timestamps have no year and only differences between them are
+        # used; a fixed leap year keeps Feb 29 valid
+        return datetime.strptime('2000 ' + timestamp, '%Y %b %d %H:%M:%S')
+    except ValueError:
+        return None
+
+
+def _iter_lines(f, chunk_size: int = _READ_CHUNK_SIZE) -> Iterator[str]:
+    """Yield the stripped, non-empty lines of a binary file from its current position"""
+    if os.fstat(f.fileno()).st_size - f.tell() > _MMAP_THRESHOLD:
+        blocks = _iter_mapped_blocks(f, chunk_size)
+    else:
+        blocks = _iter_read_blocks(f, chunk_size)
+
+    # Decoding whole blocks of complete lines never splits a character
+    for block in blocks:
+        for line in block.decode('utf-8', errors='ignore').split('\n'):
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _iter_read_blocks(f, chunk_size: int) -> Iterator[bytes]:
+    """Yield blocks of complete lines read from a file in large chunks"""
+    tail = b''
+    while True:
+        buf = f.read(chunk_size)
+        if not buf:
+            break
+
+        # The partial last line carries over to the next chunk
+        block, _, tail = (tail + buf).rpartition(b'\n')
+        yield block
+
+    yield tail
+
+
+def _iter_mapped_blocks(f, chunk_size: int) -> Iterator[bytes]:
+    """Yield blocks of complete lines sliced out of a read-only memory map"""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        pos = f.tell()
+        size = len(mm)
+        while pos < size:
+            # End the block at the last newline in the window, or at the
+            # first one after it when a single line is longer than the window
+            end = mm.rfind(b'\n', pos, pos + chunk_size)
+            if end < 0:
+                end = mm.find(b'\n', pos + chunk_size)
+                if end < 0:
+                    end = size
+
+            yield mm[pos:end]
+            pos = end + 1
+
+
+def _seek_line_start(f, offset: int):
+    """Position a binary file at the first line beginning at or after offset"""
+    if offset > 0:
+        # The line straddling offset is skipped
+        f.seek(offset - 1)
+        f.readline()
+
+
 class LogParser:
     """Parses log files into structured entries"""
 
-    # Common log patterns
-    PATTERNS = [
-        # ISO timestamp: 2024-01-15 14:23:15 ERROR message
-        re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+(\w+):\s+(.+)'),
-        # Syslog: Jan 15 14:23:15 ERROR message
-        re.compile(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\w+):\s+(.+)'),
-        # Python logging: [2024-01-15 14:23:15] ERROR message
-        re.compile(r'\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\]\s+(\w+)\s+(.+)'),
-        # Generic: ERROR: message or [ERROR] message
-        re.compile(r'\[?(\w+)\]?:\s+(.+)'),
-    ]
-
-    def parse_file(self, filepath: str) -> List[LogEntry]:
-        """Parse a log file into structured entries"""
-        entries = []
-
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+    def parse_file(self, filepath: str) -> Iterator[LogEntry]:
+        """Parse a log file, yielding structured entries as they are read"""
+        with open(filepath, 'rb') as f:
+            for line in _iter_lines(f):
+                entry = self._parse_line(line)
+                if entry:
+                    yield entry
+
+    def parse_tail(self, filepath: str, tail_bytes: int = 1 << 20) -> Iterator[LogEntry]:
+        """Parse only the complete lines within the last tail_bytes of a log file"""
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            _seek_line_start(f, max(0, size - tail_bytes))
+
+            for line in _iter_lines(f):
+                entry = self._parse_line(line)
+                if entry:
+                    yield entry
+
+    def parse_range(self, filepath: str, start: int, end: int) -> Iterator[LogEntry]:
+        """Parse the lines of a log file that begin within the byte range [start, end)"""
+        with open(filepath, 'rb') as f:
+            # The line straddling start belongs to the previous range
+            _seek_line_start(f, start)
+
+            pos = f.tell()
+            while pos < end:
+                raw = f.readline()
+                if not raw:
+                    break
+                pos += len(raw)
+
+                line = raw.decode('utf-8', errors='ignore').strip()
                 if not line:
                     continue
 
                 entry = self._parse_line(line)
                 if entry:
-                    entries.append(entry)
-
-        console.print(f"[green]✓[/green] Parsed {len(entries)} log entries from {filepath}")
-        return entries
+                    yield entry
 
     def _parse_line(self, line: str) -> LogEntry:
         """Parse a single log line"""
-        for pattern in self.PATTERNS:
-            match = pattern.match(line)
-            if match:
-                groups = match.groups()
-
-                if len(groups) == 3:
-                    timestamp, level, message = groups
-                elif len(groups) == 2:
-                    # No timestamp
-                    timestamp = "unknown"
-                    level, message = groups
-                else:
-                    continue
+        if len(line) < _MIN_LINE_LENGTH:
+            return LogEntry("unknown", "INFO", line, line)
+
+        first = line[0]
+        if first.isdigit():
+            match = _ISO_LINE.match(line)
+        elif first == '[':
+            match = _PYLOG_LINE.match(line)
+        elif first.isalpha():
+            match = _SYSLOG_LINE.match(line)
+        else:
+            match = None
+
+        if match:
+            timestamp, level, message = match.groups()
+        else:
+            match = (first == '[' and _BRACKET_LINE.match(line)) or _GENERIC_LINE.match(line)
+            if not match:
+                # If no pattern matches, treat whole line as message
+                return LogEntry("unknown", "INFO", line, line)
 
-                return LogEntry(timestamp, level.upper(), message, line)
+            # No timestamp
+            timestamp = "unknown"
+            level, message = match.groups()
 
-        # If no pattern matches, treat whole line as message
-        return LogEntry("unknown", "INFO", line, line)
+        # Adjacent lines often share a timestamp and there are only a handful
+        # of levels, so interning lets entries share one string object
+        return LogEntry(sys.intern(timestamp), sys.intern(level.upper()), message, line)
 
 
 class PatternDetector:
     """Detects patterns and anomalies in logs"""
 
-    def analyze(self, entries: List[LogEntry]) -> Dict[str, Any]:
-        """Analyze log entries for patterns"""
-
-        # Count by log level
-        levels = Counter([e.level for e in entries])
-
-        # Find error patterns
-        errors = [e for e in entries if e.level in ['ERROR', 'CRITICAL', 'FATAL']]
-        error_messages = Counter([self._normalize_message(e.message) for e in errors])
+    def analyze(self, entries: Iterable[LogEntry]) -> Dict[str, Any]:
+        """Analyze log entries for patterns in a single pass"""
+        return self._summarize(*self._aggregate(entries))
+
+    def _aggregate(self, entries: Iterable[LogEntry]) -> Tuple[int, Counter, List[LogEntry], Counter]:
+        """Count levels and collect error patterns"""
+        if isinstance(entries, list):
+            # A list can be walked twice, so counting and filtering run as C loops
+            total = len(entries)
+            levels = Counter(map(_entry_level, entries))
+            errors = [e for e in entries if e.level in _ERROR_LEVELS]
+        else:
+            total = 0
+            levels = Counter()
+            errors = []
+
+            # Locals for the per-entry hot path
+            add_error = errors.append
+
+            for e in entries:
+                total += 1
+                level = e.level
+                levels[level] += 1
+                if level in _ERROR_LEVELS:
+                    add_error(e)
+
+        # Error messages repeat heavily, so each distinct one is normalized once
+        error_messages = Counter()
+        normalize = self._normalize_message
+        normalized = {}
+        lookup = normalized.get
+
+        for e in errors:
+            message = e.message
+            key = lookup(message)
+            if key is None:
+                key = normalize(message)
+                if len(normalized) < _NORMALIZE_MEMO_SIZE:
+                    normalized[message] = key
+            error_messages[key] += 1
+
+        return total, levels, errors, error_messages
+
+    def _summarize(self, total: int, levels: Counter, errors: List[LogEntry],
+                   error_messages: Counter) -> Dict[str, Any]:
+        """Build the analysis result from aggregated counts"""
+
+        # Clean logs (the common case) have nothing to rank or scan
+        if not errors:
+            return {
+                'total_entries': total,
+                'level_counts': dict(levels),
+                'error_count': 0,
+                'unique_errors': 0,
+                'top_errors': [],
+                'timeline': [],
+                'cascades': [],
+                'errors': errors
+            }
 
         # Timeline analysis
         timeline = self._build_timeline(errors)
@@ -116,21 +361,23 @@ class PatternDetector:
         # Find cascading failures (multiple errors in short time)
         cascades = self._find_cascades(errors)
 
+        # most_common(n) already selects with heapq.nlargest, O(k log n)
+        # over k unique errors, so it scales to large error sets as is
         return {
-            'total_entries': len(entries),
+            'total_entries': total,
             'level_counts': dict(levels),
             'error_count': len(errors),
             'unique_errors': len(error_messages),
             'top_errors': error_messages.most_common(5),
             'timeline': timeline,
-            'cascades': cascades
+            'cascades': cascades,
+            'errors': errors
         }
 
     def _normalize_message(self, message: str) -> str:
         """Normalize error message to find patterns"""
         # Remove numbers, IDs, timestamps
-        normalized = re.sub(r'\b\d+\b', 'N', message)
-        normalized = re.sub(r'\b[0-9a-f]{8,}\b', 'ID', normalized)
+        normalized = _NORMALIZE_TOKEN.sub(_normalize_token, message)
         return normalized[:100]  # Limit length
 
     def _build_timeline(self, errors: List[LogEntry]) -> List[Dict]:
@@ -144,31 +391,39 @@ class PatternDetector:
         return timeline
 
     def _find_cascades(self, errors: List[LogEntry]) -> List[Dict]:
-        """Find cascading failures (bursts of errors)"""
-        if len(errors) < 3:
+        """Find cascading failures (bursts of errors close together in time)"""
+        if len(errors) < _CASCADE_MIN_ERRORS:
             return []
 
         cascades = []
-        current_cascade = []
+        first = last = None
+        count = 0
+        last_time = None
 
-        for i, error in enumerate(errors):
-            if i == 0:
-                current_cascade = [error]
+        for error in errors:
+            error_time = _parse_timestamp(error.timestamp)
+            if error_time is None:
                 continue
 
-            # Simple cascade detection: 3+ errors
-            if len(current_cascade) < 10:
-                current_cascade.append(error)
-            else:
-                if len(current_cascade) >= 3:
-                    cascades.append({
-                        'count': len(current_cascade),
-                        'first': current_cascade[0].timestamp,
-                        'last': current_cascade[-1].timestamp
-                    })
-                current_cascade = [error]
+            # A gap longer than the threshold, either way (year rollover,
+            # out-of-order lines), closes the current burst
+            if last_time is not None and abs((error_time - last_time).total_seconds()) > _CASCADE_GAP_SECONDS:
+                if count >= _CASCADE_MIN_ERRORS:
+                    cascades.append({'count': count, 'first': first.timestamp, 'last': last.timestamp})
+                count = 0
+
+            if count == 0:
+                first = error
+            last = error
+            last_time = error_time
+            count += 1
 
-        return cascades[:5]  # Return top 5 cascades
+        if count >= _CASCADE_MIN_ERRORS:
+            cascades.append({'count': count, 'first': first.timestamp, 'last': last.timestamp})
+
+        # Return top 5 cascades
+        cascades.sort(key=lambda cascade: cascade['count'], reverse=True)
+        return cascades[:5]
 
 
 class AIAnalyzer:
@@ -177,6 +432,24 @@ class AIAnalyzer:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv('NVIDIA_API_KEY') or os.getenv('OPENAI_API_KEY')
         self.base_url = "https://integrate.api.nvidia.com/v1"
+        self._session = None
+
+    def _get_session(self):
+        """Return a keep-alive HTTP session, created on first use"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            })
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.5)
+            )
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
 
     def analyze(self, patterns: Dict[str, Any], sample_errors: List[LogEntry]) -> str:
         """Use AI to analyze patterns and suggest fixes"""
@@ -184,16 +457,15 @@ class AIAnalyzer:
         if not self.api_key:
             return self._fallback_analysis(patterns, sample_errors)
 
+        if requests is None:
+            console.print("[yellow]⚠ requests is not installed, using fallback analysis[/yellow]")
+            return self._fallback_analysis(patterns, sample_errors)
+
         # Prepare context for AI
         context = self._prepare_context(patterns, sample_errors)
 
         try:
-            import requests
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            session = self._get_session()
 
             payload = {
                 "model": "nvidia/llama-3.1-nemotron-70b-instruct",
@@ -226,9 +498,8 @@ PREVENTION: <strategy>
                 "max_tokens": 500
             }
 
-            response = requests.post(
+            response = session.post(
                 f"{self.base_url}/chat/completions",
-                headers=headers,
                 json=payload,
                 timeout=30
             )
@@ -246,77 +517,50 @@ PREVENTION: <strategy>
 
     def _prepare_context(self, patterns: Dict, sample_errors: List[LogEntry]) -> str:
         """Prepare log context for AI"""
-        context = f"""Total log entries: {patterns['total_entries']}
+        parts = [f"""Total log entries: {patterns['total_entries']}
 Errors found: {patterns['error_count']}
 Unique error patterns: {patterns['unique_errors']}
 
 Top error messages:
-"""
+"""]
         for msg, count in patterns['top_errors'][:3]:
-            context += f"- ({count}x) {msg}\n"
+            parts.append(f"- ({count}x) {msg}\n")
 
-        context += "\nSample error logs:\n"
+        parts.append("\nSample error logs:\n")
         for error in sample_errors[:5]:
-            context += f"[{error.timestamp}] {error.level}: {error.message[:100]}\n"
+            parts.append(f"[{error.timestamp}] {error.level}: {error.message[:100]}\n")
 
-        return context
+        return ''.join(parts)
 
     def _fallback_analysis(self, patterns: Dict, sample_errors: List[LogEntry]) -> str:
         """Fallback analysis when AI is not available"""
 
-        analysis = "ROOT CAUSE: "
-
         # Simple heuristic analysis
         if patterns['error_count'] == 0:
-            analysis += "No errors detected in logs. System appears healthy.\n\n"
-            analysis += "FIXES:\n1. No action required\n2. Continue monitoring\n3. Review info/warning logs for potential issues\n\n"
-            analysis += "PREVENTION: Maintain current monitoring and alerting"
-            return analysis
+            return _FALLBACK_TEMPLATE.format(
+                root="No errors detected in logs. System appears healthy.",
+                fixes="1. No action required\n2. Continue monitoring\n3. Review info/warning logs for potential issues",
+                prevention="Maintain current monitoring and alerting"
+            )
 
         # Check for common patterns
-        top_error = patterns['top_errors'][0][0] if patterns['top_errors'] else ""
-
-        if 'connection' in top_error.lower() or 'refused' in top_error.lower():
-            analysis += "Network connectivity or service connection failure\n\n"
-            analysis += "FIXES:\n"
-            analysis += "1. Check network connectivity between services\n"
-            analysis += "2. Verify target service is running and accepting connections\n"
-            analysis += "3. Review firewall rules and security groups\n\n"
-            analysis += "PREVENTION: Implement health checks, connection pooling, and retry logic with exponential backoff"
-
-        elif 'timeout' in top_error.lower():
-            analysis += "Service timeout - operations taking too long\n\n"
-            analysis += "FIXES:\n"
-            analysis += "1. Increase timeout values in configuration\n"
-            analysis += "2. Optimize slow database queries or API calls\n"
-            analysis += "3. Add caching layer for frequently accessed data\n\n"
-            analysis += "PREVENTION: Set up performance monitoring and alerts for slow operations"
-
-        elif 'memory' in top_error.lower() or 'oom' in top_error.lower():
-            analysis += "Memory exhaustion - possible memory leak\n\n"
-            analysis += "FIXES:\n"
-            analysis += "1. Increase memory allocation for the service\n"
-            analysis += "2. Review code for memory leaks\n"
-            analysis += "3. Restart affected services\n\n"
-            analysis += "PREVENTION: Add memory monitoring, implement proper cleanup, and consider memory profiling"
-
-        elif 'permission' in top_error.lower() or 'denied' in top_error.lower():
-            analysis += "Permission or authentication failure\n\n"
-            analysis += "FIXES:\n"
-            analysis += "1. Review and update service permissions\n"
-            analysis += "2. Verify credentials are correct and not expired\n"
-            analysis += "3. Check IAM roles and policies\n\n"
-            analysis += "PREVENTION: Implement proper credential rotation and access control management"
+        top_error = patterns['top_errors'][0][0].lower() if patterns['top_errors'] else ""
 
+        for keywords, root, fixes, prevention in _FALLBACK_RULES:
+            if any(keyword in top_error for keyword in keywords):
+                break
         else:
-            analysis += f"Multiple errors detected: {patterns['error_count']} total, {patterns['unique_errors']} unique patterns\n\n"
-            analysis += "FIXES:\n"
-            analysis += "1. Review the top error messages listed above\n"
-            analysis += "2. Check service logs around the error timestamps\n"
-            analysis += "3. Correlate with recent deployments or configuration changes\n\n"
-            analysis += "PREVENTION: Enhance logging, add monitoring alerts, and implement gradual rollouts"
+            root = f"Multiple errors detected: {patterns['error_count']} total, {patterns['unique_errors']} unique patterns"
+            fixes = ("Review the top error messages listed above",
+                     "Check service logs around the error timestamps",
+                     "Correlate with recent deployments or configuration changes")
+            prevention = "Enhance logging, add monitoring alerts, and implement gradual rollouts"
 
-        return analysis
+        return _FALLBACK_TEMPLATE.format(
+            root=root,
+            fixes='\n'.join(f"{i}. {fix}" for i, fix in enumerate(fixes, 1)),
+            prevention=prevention
+        )
 
 
 class ReportGenerator:
@@ -368,7 +612,8 @@ class ReportGenerator:
     def generate_markdown_report(self, patterns: Dict, ai_analysis: str, output_file: str):
         """Generate markdown report"""
 
-        report = f"""# 🔍 Log Analysis Report
+        with open(output_file, 'w', buffering=65536) as f:
+            f.write(f"""# 🔍 Log Analysis Report
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -380,24 +625,52 @@ class ReportGenerator:
 
 ## 🔥 Top Error Patterns
 
-"""
-        for i, (msg, count) in enumerate(patterns['top_errors'], 1):
-            report += f"{i}. **({count}x)** {msg}\n"
-
-        report += f"\n## 📅 Error Timeline\n\n"
-        for item in patterns['timeline'][:10]:
-            report += f"- `[{item['time']}]` {item['message']}\n"
+""")
+            for i, (msg, count) in enumerate(patterns['top_errors'], 1):
+                f.write(f"{i}. **({count}x)** {msg}\n")
 
-        report += f"\n## 🤖 AI Analysis\n\n{ai_analysis}\n"
+            f.write("\n## 📅 Error Timeline\n\n")
+            for item in patterns['timeline'][:10]:
+                f.write(f"- `[{item['time']}]` {item['message']}\n")
 
-        report += f"\n---\n\n*Report generated by AI-Powered Production Log Analyzer*\n"
+            f.write(f"\n## 🤖 AI Analysis\n\n{ai_analysis}\n")
 
-        with open(output_file, 'w') as f:
-            f.write(report)
+            f.write("\n---\n\n*Report generated by AI-Powered Production Log Analyzer*\n")
 
         console.print(f"[green]✓[/green] Report saved to {output_file}")
 
 
+def _aggregate_range(filepath: str, start: int, end: int) -> Tuple[int, Counter, List[LogEntry], Counter]:
+    """Worker for analyze_file_parallel: parse and aggregate one byte range"""
+    entries = LogParser().parse_range(filepath, start, end)
+    return PatternDetector()._aggregate(entries)
+
+
+def analyze_file_parallel(filepath: str, workers: int = None) -> Dict[str, Any]:
+    """Analyze a log file by splitting it into byte ranges parsed in worker processes"""
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(filepath)
+    step = max(1, -(-size // workers))
+    starts = range(0, size, step)
+    ends = [min(start + step, size) for start in starts]
+
+    total = 0
+    levels = Counter()
+    errors = []
+    error_messages = Counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields in submission order, so errors stay in file order
+        for part in executor.map(_aggregate_range, [filepath] * len(ends), starts, ends):
+            part_total, part_levels, part_errors, part_messages = part
+            total += part_total
+            levels += part_levels
+            errors += part_errors
+            error_messages += part_messages
+
+    return PatternDetector()._summarize(total, levels, errors, error_messages)
+
+
 def demo_mode():
     """Run demo with sample logs"""
     console.print(Panel.fit(
@@ -427,7 +700,7 @@ def demo_mode():
     analyze_logs(temp_file)
 
 
-def analyze_logs(filepath: str, output: str = None):
+def analyze_logs(filepath: str, output: str = None, jobs: int = 1, tail: int = None):
     """Main analysis function"""
 
     if not os.path.exists(filepath):
@@ -436,24 +709,29 @@ def analyze_logs(filepath: str, output: str = None):
 
     console.print(f"\n[cyan]Analyzing {filepath}...[/cyan]\n")
 
-    # Parse logs
-    parser = LogParser()
-    entries = parser.parse_file(filepath)
+    # Parse and detect patterns in a single streaming pass
+    console.print("[cyan]Detecting patterns...[/cyan]")
+    if jobs > 1 and not tail:
+        patterns = analyze_file_parallel(filepath, jobs)
+    else:
+        parser = LogParser()
+        detector = PatternDetector()
+        if tail:
+            entries = parser.parse_tail(filepath, tail)
+        else:
+            entries = parser.parse_file(filepath)
+        patterns = detector.analyze(entries)
 
-    if not entries:
+    if not patterns['total_entries']:
         console.print("[yellow]No log entries found[/yellow]")
         return
 
-    # Detect patterns
-    console.print("[cyan]Detecting patterns...[/cyan]")
-    detector = PatternDetector()
-    patterns = detector.analyze(entries)
+    console.print(f"[green]✓[/green] Parsed {patterns['total_entries']} log entries from {filepath}")
 
     # AI analysis
     console.print("[cyan]Running AI analysis...[/cyan]")
-    errors = [e for e in entries if e.level in ['ERROR', 'CRITICAL', 'FATAL']]
     analyzer = AIAnalyzer()
-    ai_analysis = analyzer.analyze(patterns, errors[:10])
+    ai_analysis = analyzer.analyze(patterns, patterns['errors'][:10])
 
     # Generate report
     reporter = ReportGenerator()
@@ -463,6 +741,23 @@ def analyze_logs(filepath: str, output: str = None):
         reporter.generate_markdown_report(patterns, ai_analysis, output)
 
 
+def parse_size(value: str) -> int:
+    """Parse a byte size such as 512K, 1M or 2G"""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    number = value.strip().upper().rstrip('B')
+    multiplier = units.get(number[-1:], 1)
+    if multiplier > 1:
+        number = number[:-1]
+
+    try:
+        size = int(float(number) * multiplier)
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    if size <= 0:
+        raise argparse.ArgumentTypeError("size must be positive")
+    return size
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='AI-Powered Production Log Analyzer',
@@ -471,6 +766,7 @@ def main():
 Examples:
   %(prog)s analyze myapp.log              # Analyze a log file
   %(prog)s analyze app.log -o report.md   # Generate markdown report
+  %(prog)s analyze app.log --tail 1M      # Only analyze the last 1 MB
   %(prog)s demo                           # Run demo with sample logs
         """
     )
@@ -481,6 +777,10 @@ Examples:
     analyze_parser = subparsers.add_parser('analyze', help='Analyze log file')
     analyze_parser.add_argument('file', help='Path to log file')
     analyze_parser.add_argument('-o', '--output', help='Output report file (markdown)')
+    analyze_parser.add_argument('-j', '--jobs', type=int, default=1,
+                                help='Parse with N worker processes (default: 1)')
+    analyze_parser.add_argument('--tail', type=parse_size, metavar='SIZE',
+                                help='Only analyze the last SIZE of the file, e.g. 1M')
 
     # Demo command
     demo_parser = subparsers.add_parser('demo', help='Run demo with sample logs')
@@ -488,7 +788,7 @@ Examples:
     args = parser.parse_args()
 
     if args.command == 'analyze':
-        analyze_logs(args.file, args.output)
+        analyze_logs(args.file, args.output, args.jobs, args.tail)
     elif args.command == 'demo':
         demo_mode()
     else:
@@ -5,9 +5,9 @@ Prepares content, tracks tasks, and helps you stay organized during launch
 """
 
 import os
+import subprocess
 import sys
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 try:
@@ -15,13 +15,13 @@ try:
     from rich.table import Table
     from rich.panel import Panel
     from rich.prompt import Prompt, Confirm
-    from rich.progress import Progress, SpinnerColumn, TextColumn
 except ImportError:
     print("Installing required packages...")
-    os.system("pip install rich")
+    subprocess.run([sys.executable, "-m", "pip", "install", "rich"], check=False)
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
 
 console = Console()
 
@@ -88,8 +88,8 @@ This ensures authenticity and lets you engage with your audience.""",
 
     def _check_tag(self):
         """Check if v1.0.0 tag exists"""
-        result = os.popen("git tag").read()
-        return "v1.0.0" in result
+        result = subprocess.run(["git", "tag", "-l", "v1.0.0"], capture_output=True, text=True, check=False)
+        return bool(result.stdout.strip())
 
     def create_github_release(self):
         """Guide user to create GitHub release"""
@@ -117,8 +117,7 @@ This ensures authenticity and lets you engage with your audience.""",
         content_file = self.launch_dir / "01_linkedin_main_post.md"
 
         if content_file.exists():
-            with open(content_file) as f:
-                content = f.read()
+            content = content_file.read_text(encoding='utf-8')
 
             # Extract the actual post content
             lines = content.split('\n')
@@ -130,15 +129,14 @@ This ensures authenticity and lets you engage with your audience.""",
                     post_start = True
                 if post_start and line.startswith('---'):
                     break
-                if post_start and not line.startswith('**WHEN TO POST:**') and not line.startswith('**ADD:**'):
+                if post_start and not line.startswith(('**WHEN TO POST:**', '**ADD:**')):
                     post_lines.append(line)
 
             post = '\n'.join(post_lines).strip()
 
             # Save to clipboard-ready file
             clipboard_file = "/tmp/linkedin_post.txt"
-            with open(clipboard_file, 'w') as f:
-                f.write(post)
+            Path(clipboard_file).write_text(post, encoding='utf-8')
 
             console.print(Panel(
                 f"""[bold green]LinkedIn Post Ready![/bold green]
@@ -176,8 +174,7 @@ cat {clipboard_file}
         content_file = self.launch_dir / "02_twitter_thread.md"
 
         if content_file.exists():
-            with open(content_file) as f:
-                content = f.read()
+            content = content_file.read_text(encoding='utf-8')
 
             # Extract tweets
             tweets = []
@@ -198,7 +195,7 @@ cat {clipboard_file}
 
             # Save numbered tweets
             tweet_file = "/tmp/twitter_thread.txt"
-            with open(tweet_file, 'w') as f:
+            with open(tweet_file, 'w', encoding='utf-8') as f:
                 for i, tweet in enumerate(tweets[:10], 1):
                     f.write(f"=== TWEET {i}/10 ===\n")
                     f.write(tweet)
@@ -235,8 +232,7 @@ cat {clipboard_file}
         content_file = self.launch_dir / "04_reddit_posts.md"
 
         if content_file.exists():
-            with open(content_file) as f:
-                content = f.read()
+            content = content_file.read_text(encoding='utf-8')
 
             # Find the specific subreddit section
             sections = content.split(f"## r/{subreddit}")
@@ -249,9 +245,9 @@ cat {clipboard_file}
                 post = []
                 in_post = False
 
-                for line in lines:
-                    if line.startswith('**Title:**'):
-                        title = lines[lines.index(line) + 1].strip()
+                for idx, line in enumerate(lines):
+                    if not in_post and line.startswith('**Title:**') and idx + 1 < len(lines):
+                        title = lines[idx + 1].strip()
                     if line.startswith('**Post:**'):
                         in_post = True
                         continue
@@ -264,7 +260,7 @@ cat {clipboard_file}
 
                 # Save to file
                 reddit_file = f"/tmp/reddit_{subreddit}.txt"
-                with open(reddit_file, 'w') as f:
+                with open(reddit_file, 'w', encoding='utf-8') as f:
                     f.write(f"TITLE:\n{title}\n\n")
                     f.write(f"POST:\n{post_content}\n")
 
@@ -297,8 +293,7 @@ Saved to: {reddit_file}
         content_file = self.launch_dir / "03_hackernews_post.md"
 
         if content_file.exists():
-            with open(content_file) as f:
-                content = f.read()
+            content = content_file.read_text(encoding='utf-8')
 
             # Extract title and comment
             lines = content.split('\n')
@@ -320,7 +315,7 @@ Saved to: {reddit_file}
 
             # Save to file
             hn_file = "/tmp/hackernews_post.txt"
-            with open(hn_file, 'w') as f:
+            with open(hn_file, 'w', encoding='utf-8') as f:
                 f.write(f"TITLE:\n{title}\n\n")
                 f.write(f"URL:\nhttps://github.com/KlementMultiverse/api-documentation-generator\n\n")
                 f.write(f"COMMENT (post immediately after submitting):\n{comment_text}\n")
@@ -441,9 +436,11 @@ Saved to: {hn_file}
 
         # Offer to open files
         if Confirm.ask("\nShow LinkedIn post now?"):
-            linkedin_file = "/tmp/linkedin_post.txt"
-            os.system(f"cat {linkedin_file}")
-            console.print(f"\n[green]Copy this and paste to LinkedIn![/green]")
+            if linkedin_file and Path(linkedin_file).exists():
+                print(Path(linkedin_file).read_text(encoding='utf-8'))
+                console.print(f"\n[green]Copy this and paste to LinkedIn![/green]")
+            else:
+                console.print("[red]Content file not found![/red]")
 
     def monitor_mode(self):
         """Monitor GitHub stars and provide alerts"""
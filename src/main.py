@@ -8,14 +8,57 @@ Updated: 2025-10-06 - Added full implementation
 """
 
 import ast
+import hashlib
+import io
 import os
+import sys
+import time
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
-from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump whenever parse_file output changes so stale cache entries are ignored
+_PARSE_CACHE_VERSION = 3
+_DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'apidocgen'
+
+# Decorators that mark a function as an HTTP endpoint (Flask/FastAPI style)
+_API_DECORATORS = frozenset({
+    'app.route', 'router.get', 'router.post', 'router.put',
+    'router.delete', 'get', 'post', 'put', 'delete'
+})
+
+# Module-level compound statements whose bodies may hold imports and definitions;
+# the getattr defaults cover interpreters without try/except* (3.11) or match (3.10)
+_BLOCK_NODES = (ast.If, ast.Try, ast.With, ast.AsyncWith, getattr(ast, 'TryStar', ()))
+_MATCH_NODES = getattr(ast, 'Match', ())
+
+# Output file suffix for each supported format
+_OUTPUT_SUFFIXES = {
+    'markdown': '_api.md',
+    'openapi': '_openapi.json',
+    'json': '_api.json'
+}
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _timestamp() -> str:
+    """Get current timestamp"""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
 
 
 @dataclass
@@ -43,10 +86,48 @@ class APIClass:
 class PythonCodeParser:
     """Parse Python code to extract API information"""
 
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Set up the on-disk parse cache (APIDOCGEN_CACHE_DIR=off disables it)"""
+        cache_dir = cache_dir or os.getenv('APIDOCGEN_CACHE_DIR') or _DEFAULT_CACHE_DIR
+        self.cache_dir = None if str(cache_dir) == 'off' else Path(cache_dir)
+
     def parse_file(self, filepath: str) -> Dict[str, Any]:
-        """Parse a Python file and extract API info"""
-        with open(filepath, 'r') as f:
-            code = f.read()
+        """Parse a Python file and extract API info, reusing the cache if unchanged"""
+        if self.cache_dir is None:
+            return self._parse_source(filepath)
+
+        stat = os.stat(filepath)
+        # The ast module's output varies between Python versions
+        key = f"{_PARSE_CACHE_VERSION}-{sys.version_info[0]}.{sys.version_info[1]}-{stat.st_mtime_ns}-{stat.st_size}"
+        digest = hashlib.sha1(os.path.abspath(filepath).encode()).hexdigest()
+        cache_file = self.cache_dir / f"{digest}.json"
+
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached['data']
+        except (OSError, ValueError):
+            pass
+
+        api_info = self._parse_source(filepath)
+
+        # Write via a temp file so concurrent workers never see a partial entry
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'key': key, 'data': api_info}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+        return api_info
+
+    def _parse_source(self, filepath: str) -> Dict[str, Any]:
+        """Parse the source of a Python file"""
+        # Bytes go straight to the tokenizer, which also honours coding cookies
+        code = Path(filepath).read_bytes()
 
         tree = ast.parse(code)
 
@@ -57,17 +138,33 @@ class PythonCodeParser:
             'imports': []
         }
 
-        for node in ast.walk(tree):
+        for node in self._iter_module_nodes(tree.body):
             if isinstance(node, ast.ClassDef):
                 api_info['classes'].append(self._parse_class(node))
             elif isinstance(node, ast.FunctionDef):
-                if not self._is_method(node):
-                    api_info['functions'].append(self._parse_function(node))
-            elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
+                api_info['functions'].append(self._parse_function(node))
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
                 api_info['imports'].append(self._parse_import(node))
 
         return api_info
 
+    def _iter_module_nodes(self, body):
+        """Yield module-scope statements, looking inside if/try/with/match blocks but never into function or class bodies"""
+        stack = list(reversed(body))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _BLOCK_NODES):
+                children = list(node.body)
+                for handler in getattr(node, 'handlers', ()):
+                    children.extend(handler.body)
+                children.extend(getattr(node, 'orelse', ()))
+                children.extend(getattr(node, 'finalbody', ()))
+                stack.extend(reversed(children))
+            elif isinstance(node, _MATCH_NODES):
+                stack.extend(reversed([child for case in node.cases for child in case.body]))
+            else:
+                yield node
+
     def _parse_class(self, node: ast.ClassDef) -> Dict[str, Any]:
         """Parse a class definition"""
         return {
@@ -87,10 +184,6 @@ class PythonCodeParser:
             'decorators': [self._get_decorator_name(d) for d in node.decorator_list]
         }
 
-    def _is_method(self, node: ast.FunctionDef) -> bool:
-        """Check if function is a method (has self parameter)"""
-        return len(node.args.args) > 0 and node.args.args[0].arg in ['self', 'cls']
-
     def _get_name(self, node) -> str:
         """Get name from AST node"""
         if isinstance(node, ast.Name):
@@ -102,9 +195,26 @@ class PythonCodeParser:
     def _get_return_annotation(self, node: ast.FunctionDef) -> Optional[str]:
         """Get return type annotation"""
         if node.returns:
-            return ast.unparse(node.returns)
+            return self._annotation_str(node.returns)
         return None
 
+    def _annotation_str(self, node) -> str:
+        """Render an annotation, building common shapes directly and leaving the rest to ast.unparse"""
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute) and isinstance(node.value, (ast.Name, ast.Attribute)):
+            return f"{self._annotation_str(node.value)}.{node.attr}"
+        if isinstance(node, ast.Constant) and node.value is None:
+            return 'None'
+        if isinstance(node, ast.Subscript) and isinstance(node.value, (ast.Name, ast.Attribute)):
+            inner = node.slice
+            if not isinstance(inner, ast.Tuple):
+                return f"{self._annotation_str(node.value)}[{self._annotation_str(inner)}]"
+            if len(inner.elts) > 1:
+                args = ', '.join(self._annotation_str(elt) for elt in inner.elts)
+                return f"{self._annotation_str(node.value)}[{args}]"
+        return ast.unparse(node)
+
     def _get_decorator_name(self, node) -> str:
         """Get decorator name"""
         if isinstance(node, ast.Name):
@@ -127,65 +237,64 @@ class PythonCodeParser:
 class MarkdownGenerator:
     """Generate markdown documentation"""
 
-    def generate(self, api_info: Dict[str, Any], title: str = None) -> str:
+    def generate(self, api_info: Dict[str, Any], title: str = None, timestamp: str = None) -> str:
         """Generate markdown documentation from API info"""
-        md = []
+        buf = io.StringIO()
+        self.write(api_info, buf, title, timestamp)
+        return buf.getvalue()
+
+    def write(self, api_info: Dict[str, Any], fp, title: str = None, timestamp: str = None) -> None:
+        """Stream markdown documentation to a text file object"""
+        w = fp.write
 
-        # Header
+        # Header; every later block starts with the newline that separates it from the previous one
         title = title or f"API Documentation - {api_info['filename']}"
-        md.append(f"# {title}\n")
-        md.append(f"**Generated:** {self._get_timestamp()}\n")
-        md.append("---\n")
+        w(f"# {title}\n")
+        w(f"\n**Generated:** {timestamp or _timestamp()}\n")
+        w("\n---\n")
 
         # Imports
         if api_info['imports']:
-            md.append("## 📦 Imports\n")
+            w("\n## 📦 Imports\n")
             for imp in api_info['imports'][:10]:
-                md.append(f"- `{imp}`")
-            md.append("\n")
+                w(f"\n- `{imp}`")
+            w("\n\n")
 
         # Classes
         if api_info['classes']:
-            md.append("## 🏛️ Classes\n")
+            w("\n## 🏛️ Classes\n")
             for cls in api_info['classes']:
-                md.append(f"### `{cls['name']}`\n")
+                w(f"\n### `{cls['name']}`\n")
                 if cls['docstring']:
-                    md.append(f"{cls['docstring']}\n")
+                    w(f"\n{cls['docstring']}\n")
 
                 if cls['bases']:
-                    md.append(f"**Inherits:** {', '.join(cls['bases'])}\n")
+                    w(f"\n**Inherits:** {', '.join(cls['bases'])}\n")
 
                 # Methods
                 if cls['methods']:
-                    md.append("**Methods:**\n")
+                    w("\n**Methods:**\n")
                     for method in cls['methods']:
                         params = ', '.join(method['parameters'])
                         returns = f" -> {method['returns']}" if method['returns'] else ""
-                        md.append(f"- `{method['name']}({params}){returns}`")
+                        w(f"\n- `{method['name']}({params}){returns}`")
                         if method['docstring']:
-                            md.append(f"  - {method['docstring'].split(chr(10))[0]}")
-                md.append("\n")
+                            w(f"\n  - {method['docstring'].split(chr(10))[0]}")
+                w("\n\n")
 
         # Functions
         if api_info['functions']:
-            md.append("## 🔧 Functions\n")
+            w("\n## 🔧 Functions\n")
             for func in api_info['functions']:
                 params = ', '.join(func['parameters'])
                 returns = f" -> {func['returns']}" if func['returns'] else ""
-                md.append(f"### `{func['name']}({params}){returns}`\n")
+                w(f"\n### `{func['name']}({params}){returns}`\n")
                 if func['docstring']:
-                    md.append(f"{func['docstring']}\n")
+                    w(f"\n{func['docstring']}\n")
 
                 if func['decorators']:
-                    md.append(f"**Decorators:** {', '.join(func['decorators'])}\n")
-                md.append("\n")
-
-        return '\n'.join(md)
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    w(f"\n**Decorators:** {', '.join(func['decorators'])}\n")
+                w("\n\n")
 
 
 class OpenAPIGenerator:
@@ -224,9 +333,8 @@ class OpenAPIGenerator:
 
     def _is_api_method(self, method: Dict) -> bool:
         """Check if method is an API endpoint"""
-        api_decorators = ['app.route', 'router.get', 'router.post', 'router.put',
-                         'router.delete', 'get', 'post', 'put', 'delete']
-        return any(dec in method.get('decorators', []) for dec in api_decorators)
+        decorators = method.get('decorators')
+        return bool(decorators) and not _API_DECORATORS.isdisjoint(decorators)
 
     def _extract_endpoint(self, method: Dict) -> Optional[Dict]:
         """Extract endpoint information from method"""
@@ -251,77 +359,165 @@ class OpenAPIGenerator:
         }
 
 
+@lru_cache(maxsize=1)
+def _env_config() -> Dict[str, Any]:
+    """Read .env and the environment once per process"""
+    # Deferred so importing this module doesn't pay for dotenv
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    return {
+        'api_key': os.getenv('API_KEY'),
+        'output_dir': os.getenv('OUTPUT_DIR', 'docs/api')
+    }
+
+
+def _iter_py_files(root: str):
+    """Yield paths of .py files under root, pruning __pycache__ and hidden directories"""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Skip unreadable directories rather than abort the walk, as Path.rglob does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__' and not entry.name.startswith('.'):
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+
+def _output_names(py_files: List[str], root: str) -> Dict[str, str]:
+    """Map each file to its output base name, qualifying stems shared by several files (e.g. pkg.__init__)"""
+    stems = Counter(Path(py_file).stem for py_file in py_files)
+    names = {}
+    for py_file in py_files:
+        name = Path(py_file).stem
+        if stems[name] > 1:
+            name = '.'.join(Path(os.path.relpath(py_file, root)).with_suffix('').parts)
+        names[py_file] = name
+    return names
+
+
+def _batch_output_names(sources: List[str]) -> Dict[str, str]:
+    """Output base names for every file under several sources, qualifying shared stems against their common parent"""
+    py_files = []
+    roots = []
+    for source in sources:
+        path = Path(source)
+        if path.is_file():
+            py_files.append(str(path))
+            roots.append(os.path.abspath(path.parent))
+        elif path.is_dir():
+            py_files.extend(_iter_py_files(str(path)))
+            roots.append(os.path.abspath(path))
+    return _output_names(py_files, os.path.commonpath(roots)) if roots else {}
+
+
+def _generate_file(filepath, output_formats: List[str], output_dir: str, timestamp: str = None,
+                   name: str = None) -> List[str]:
+    """Parse one file once and write its docs in each format; module-level so worker processes can run it"""
+    filepath = Path(filepath)
+    name = name or filepath.stem
+    for output_format in output_formats:
+        if output_format not in _OUTPUT_SUFFIXES:
+            raise ValueError(f"Unsupported format: {output_format}")
+
+    api_info = PythonCodeParser().parse_file(str(filepath))
+
+    # Save to output directory
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_paths = []
+    for output_format in output_formats:
+        output_path = output_dir / (name + _OUTPUT_SUFFIXES[output_format])
+
+        if output_format == 'markdown':
+            # Markdown is rendered straight into the output file
+            with open(output_path, 'w', encoding='utf-8') as f:
+                MarkdownGenerator().write(api_info, f, timestamp=timestamp)
+        elif output_format == 'openapi':
+            output_path.write_bytes(_dump_json(OpenAPIGenerator().generate(api_info)))
+        else:
+            output_path.write_bytes(_dump_json(api_info))
+
+        output_paths.append(str(output_path))
+
+    return output_paths
+
+
 class APIDocumentationGenerator:
     """Main application class"""
 
     def __init__(self):
         """Initialize the application"""
         self.config = self._load_config()
-        self.parser = PythonCodeParser()
-        self.md_generator = MarkdownGenerator()
-        self.openapi_generator = OpenAPIGenerator()
+        self.verbose = False
 
     def _load_config(self):
         """Load configuration from environment"""
-        return {
-            'api_key': os.getenv('API_KEY'),
-            'output_dir': os.getenv('OUTPUT_DIR', 'docs/api')
-        }
+        # Copied because callers override entries (e.g. output_dir from --output)
+        return dict(_env_config())
 
-    def generate_docs(self, source_path: str, output_format: str = 'markdown') -> str:
-        """Generate documentation for a Python file or directory"""
+    def generate_docs(self, source_path: str, output_format: Union[str, List[str]] = 'markdown',
+                      names: Optional[Dict[str, str]] = None) -> Union[str, List[str]]:
+        """Generate documentation for a Python file or directory in one or more formats, optionally with batch-wide output names"""
         path = Path(source_path)
+        output_formats = [output_format] if isinstance(output_format, str) else list(output_format)
 
         if path.is_file():
-            return self._generate_single_file(path, output_format)
+            return self._generate_single_file(path, output_formats, names)
         elif path.is_dir():
-            return self._generate_directory(path, output_format)
+            return self._generate_directory(path, output_formats, names)
         else:
             raise ValueError(f"Invalid path: {source_path}")
 
-    def _generate_single_file(self, filepath: Path, output_format: str) -> str:
-        """Generate docs for a single file"""
-        print(f"📄 Parsing {filepath.name}...")
-        api_info = self.parser.parse_file(str(filepath))
-
-        if output_format == 'markdown':
-            docs = self.md_generator.generate(api_info)
-            output_file = filepath.stem + '_api.md'
-        elif output_format == 'openapi':
-            docs = json.dumps(self.openapi_generator.generate(api_info), indent=2)
-            output_file = filepath.stem + '_openapi.json'
-        elif output_format == 'json':
-            docs = json.dumps(api_info, indent=2)
-            output_file = filepath.stem + '_api.json'
-        else:
-            raise ValueError(f"Unsupported format: {output_format}")
-
-        # Save to output directory
-        output_dir = Path(self.config['output_dir'])
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / output_file
-
-        with open(output_path, 'w') as f:
-            f.write(docs)
-
-        print(f"✅ Documentation saved to {output_path}")
-        return str(output_path)
-
-    def _generate_directory(self, dirpath: Path, output_format: str) -> str:
+    def _generate_single_file(self, filepath: Path, output_formats: List[str],
+                              names: Optional[Dict[str, str]] = None) -> Union[str, List[str]]:
+        """Generate docs for a single file; returns its output path, or a list of them for several formats"""
+        if self.verbose:
+            print(f"📄 Parsing {filepath.name}...")
+        timestamp = _timestamp()
+        name = names.get(str(filepath)) if names else None
+        output_paths = _generate_file(filepath, output_formats, self.config['output_dir'], timestamp, name)
+        for output_path in output_paths:
+            print(f"✅ Documentation saved to {output_path}")
+        return output_paths[0] if len(output_paths) == 1 else output_paths
+
+    def _generate_directory(self, dirpath: Path, output_formats: List[str],
+                            names: Optional[Dict[str, str]] = None) -> str:
         """Generate docs for all Python files in directory"""
-        py_files = list(dirpath.rglob('*.py'))
+        py_files = list(_iter_py_files(str(dirpath)))
+        # Files are written in parallel, so no two may share an output path
+        names = names or _output_names(py_files, str(dirpath))
         print(f"📁 Found {len(py_files)} Python files in {dirpath}")
 
+        # Parsing is CPU-bound, so files are spread across worker processes
+        timestamp = _timestamp()
         results = []
-        for py_file in py_files:
-            if '__pycache__' not in str(py_file):
+        documented = 0
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(_generate_file, py_file, output_formats, self.config['output_dir'], timestamp,
+                                names.get(py_file)): py_file
+                for py_file in py_files
+            }
+            for future in as_completed(futures):
                 try:
-                    output_path = self._generate_single_file(py_file, output_format)
-                    results.append(output_path)
+                    output_paths = future.result()
+                    if self.verbose:
+                        for output_path in output_paths:
+                            print(f"✅ Documentation saved to {output_path}")
+                    results.extend(output_paths)
+                    documented += 1
                 except Exception as e:
-                    print(f"⚠️  Error processing {py_file}: {e}")
+                    print(f"⚠️  Error processing {futures[future]}: {e}")
 
-        print(f"\n✅ Generated documentation for {len(results)} files")
+        print(f"\n✅ Generated documentation for {documented} files")
         return f"Generated {len(results)} documentation files"
 
     def run(self):
@@ -334,44 +530,67 @@ class APIDocumentationGenerator:
         print(f"Demo: Generating docs for {demo_file}\n")
 
         try:
-            self.generate_docs(demo_file, output_format='markdown')
-            self.generate_docs(demo_file, output_format='json')
+            self.generate_docs(demo_file, output_format=['markdown', 'json'])
             print("\n✨ Demo complete! Check docs/api/ directory")
         except Exception as e:
             print(f"❌ Error: {e}")
 
 
+def _read_arg_line(line: str) -> List[str]:
+    """Read one line of an @file source list, skipping blank lines and # comments"""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return []
+    return [line]
+
+
 def main():
     """Entry point"""
     import argparse
 
     parser = argparse.ArgumentParser(
-        description='API Documentation Generator - Auto-generate docs from Python code'
+        description='API Documentation Generator - Auto-generate docs from Python code',
+        fromfile_prefix_chars='@',
+        epilog='Source paths can also be listed one per line in a file and passed as @list.txt'
     )
-    parser.add_argument('source', nargs='?', help='Python file or directory to document')
-    parser.add_argument('-f', '--format', default='markdown',
+    parser.convert_arg_line_to_args = _read_arg_line
+    parser.add_argument('sources', nargs='*', metavar='source',
+                       help='Python files or directories to document')
+    parser.add_argument('-f', '--format', action='append',
                        choices=['markdown', 'openapi', 'json'],
-                       help='Output format (default: markdown)')
+                       help='Output format, repeat for several (default: markdown)')
     parser.add_argument('-o', '--output', help='Output directory (default: docs/api)')
     parser.add_argument('--demo', action='store_true', help='Run demo mode')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Report every file as it is processed')
 
     args = parser.parse_args()
+    # An empty path would resolve to the current directory
+    sources = [source for source in args.sources if source.strip()]
 
     app = APIDocumentationGenerator()
 
+    app.verbose = args.verbose
     if args.output:
         app.config['output_dir'] = args.output
 
-    if args.demo or not args.source:
+    if args.demo or not sources:
         app.run()
-    else:
+        return 0
+
+    # One process handles every source so startup and imports are paid once
+    output_formats = args.format or ['markdown']
+    # Every source writes to the same directory, so names are assigned across the batch
+    names = _batch_output_names(sources) if len(sources) > 1 else None
+    status = 0
+    for source in sources:
         try:
-            app.generate_docs(args.source, output_format=args.format)
+            app.generate_docs(source, output_format=output_formats, names=names)
         except Exception as e:
             print(f"❌ Error: {e}")
-            return 1
+            status = 1
 
-    return 0
+    return status
 
 
 if __name__ == "__main__":
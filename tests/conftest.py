@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Make the top-level analyzer module and src/main.py importable from the tests
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'src'))
@@ -0,0 +1,169 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import main as docgen
+from main import APIDocumentationGenerator, PythonCodeParser, main, _generate_file
+
+
+@pytest.fixture(autouse=True)
+def no_parse_cache(monkeypatch):
+    """Keep the parse cache out of the user's home directory"""
+    monkeypatch.setenv('APIDOCGEN_CACHE_DIR', 'off')
+
+
+def test_generate_directory_same_named_files(tmp_path):
+    """Test files sharing a name in different packages get separate docs"""
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "other").mkdir()
+    (src / "pkg" / "__init__.py").write_text('"""pkg package"""\n')
+    (src / "other" / "__init__.py").write_text('"""other package"""\n')
+    (src / "mod.py").write_text("def f(): pass\n")
+
+    app = APIDocumentationGenerator()
+    app.config['output_dir'] = str(tmp_path / "docs")
+    app.generate_docs(str(src))
+
+    docs = sorted(p.name for p in (tmp_path / "docs").iterdir())
+    assert docs == ["mod_api.md", "other.__init___api.md", "pkg.__init___api.md"]
+
+
+
+def test_generate_directory_skips_unreadable_subdirectory(tmp_path, monkeypatch):
+    """Test an unreadable subdirectory is skipped and the rest is still documented"""
+    src = tmp_path / "src"
+    (src / "locked").mkdir(parents=True)
+    (src / "locked" / "hidden.py").write_text("def hidden(): pass\n")
+    (src / "mod.py").write_text("def f(): pass\n")
+
+    scandir = os.scandir
+
+    def guarded_scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', guarded_scandir)
+
+    app = APIDocumentationGenerator()
+    app.config['output_dir'] = str(tmp_path / "docs")
+    app.generate_docs(str(src))
+
+    assert [p.name for p in (tmp_path / "docs").iterdir()] == ["mod_api.md"]
+
+def test_parse_cache_hit_and_invalidation(tmp_path, monkeypatch):
+    """Test an unchanged file is served from the cache and a changed one is re-parsed"""
+    monkeypatch.setenv('APIDOCGEN_CACHE_DIR', str(tmp_path / "cache"))
+    source = tmp_path / "mod.py"
+    source.write_text("def first(): pass\n")
+
+    parser = PythonCodeParser()
+    assert [f['name'] for f in parser.parse_file(str(source))['functions']] == ['first']
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def fail(filepath):
+        raise AssertionError("unchanged file was re-parsed")
+
+    parse_source = parser._parse_source
+    monkeypatch.setattr(parser, '_parse_source', fail)
+    assert [f['name'] for f in parser.parse_file(str(source))['functions']] == ['first']
+
+    # The size changes too, so coarse mtime resolution cannot hide the edit
+    monkeypatch.setattr(parser, '_parse_source', parse_source)
+    source.write_text("def first(): pass\n\n\ndef second(): pass\n")
+    assert [f['name'] for f in parser.parse_file(str(source))['functions']] == ['first', 'second']
+
+
+def test_parse_cache_off(tmp_path, monkeypatch):
+    """Test APIDOCGEN_CACHE_DIR=off disables the cache"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(docgen, '_DEFAULT_CACHE_DIR', cache_dir)
+    source = tmp_path / "mod.py"
+    source.write_text("def first(): pass\n")
+
+    parser = PythonCodeParser()
+    assert parser.cache_dir is None
+    assert parser.parse_file(str(source))['functions'][0]['name'] == 'first'
+    assert not cache_dir.exists()
+
+    # Without the override the same parse does populate the default directory
+    monkeypatch.delenv('APIDOCGEN_CACHE_DIR')
+    PythonCodeParser().parse_file(str(source))
+    assert cache_dir.exists()
+
+
+def test_cli_multiple_sources_and_file_list(tmp_path, monkeypatch):
+    """Test sources from the command line and an @file list, skipping its blank and comment lines"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "stray.py").write_text("def stray(): pass\n")
+    for name in ("one", "two", "three"):
+        (tmp_path / f"{name}.py").write_text(f"def {name}(): pass\n")
+    # Same-named files from different sources must not overwrite each other
+    for name in ("a", "b", "pkg_a", "pkg_b"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "a" / "util.py").write_text("def a(): pass\n")
+    (tmp_path / "b" / "util.py").write_text("def b(): pass\n")
+    (tmp_path / "pkg_a" / "__init__.py").write_text("def pkg_a(): pass\n")
+    (tmp_path / "pkg_b" / "__init__.py").write_text("def pkg_b(): pass\n")
+    (tmp_path / "list.txt").write_text("two.py\n\n# skipped\n   \nthree.py\npkg_a\npkg_b\n")
+
+    monkeypatch.setattr(sys, 'argv', ['main.py', 'one.py', 'a/util.py', 'b/util.py', '@list.txt', '-o', 'docs'])
+    assert main() == 0
+
+    docs = sorted(p.name for p in (tmp_path / "docs").iterdir())
+    assert docs == ["a.util_api.md", "b.util_api.md", "one_api.md", "pkg_a.__init___api.md",
+                    "pkg_b.__init___api.md", "three_api.md", "two_api.md"]
+    assert "### `a()`" in (tmp_path / "docs" / "a.util_api.md").read_text()
+    assert "### `b()`" in (tmp_path / "docs" / "b.util_api.md").read_text()
+
+
+def test_generate_file_multiple_formats(tmp_path):
+    """Test one call writes a document per requested format"""
+    source = tmp_path / "mod.py"
+    source.write_text('def f():\n    """Do f"""\n')
+
+    output_paths = _generate_file(source, ['markdown', 'json'], tmp_path / "docs", timestamp="2025-01-01 00:00:00")
+
+    assert [Path(p).name for p in output_paths] == ["mod_api.md", "mod_api.json"]
+    assert "**Generated:** 2025-01-01 00:00:00" in (tmp_path / "docs" / "mod_api.md").read_text()
+    assert '"name": "f"' in (tmp_path / "docs" / "mod_api.json").read_text()
+
+
+def test_parse_guarded_module_statements(tmp_path):
+    """Test imports and definitions inside try/except*, async with and match blocks are found"""
+    source = tmp_path / "mod.py"
+    source.write_text(
+        "try:\n"
+        "    import json\n"
+        "except* ImportError:\n"
+        "    import simplejson as json\n"
+        "async with lock:\n"
+        "    def locked(): pass\n"
+        "match mode:\n"
+        "    case 'fast':\n"
+        "        def fast(): pass\n"
+        "    case _:\n"
+        "        class Slow: pass\n"
+    )
+
+    api_info = PythonCodeParser().parse_file(str(source))
+
+    assert api_info['imports'] == ['json', 'simplejson']
+    assert [f['name'] for f in api_info['functions']] == ['locked', 'fast']
+    assert [c['name'] for c in api_info['classes']] == ['Slow']
+
+
+def test_generate_docs_single_file_return(tmp_path):
+    """Test a single file returns its output path, or every path when several formats are requested"""
+    source = tmp_path / "mod.py"
+    source.write_text("def f(): pass\n")
+
+    app = APIDocumentationGenerator()
+    app.config['output_dir'] = str(tmp_path / "docs")
+
+    assert Path(app.generate_docs(str(source))).name == "mod_api.md"
+    assert [Path(p).name for p in app.generate_docs(str(source), ['markdown', 'json'])] == [
+        "mod_api.md", "mod_api.json"]
@@ -1,11 +1,9 @@
-import pytest
-import sys
-import os
+import argparse
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
-from analyzer import LogParser, LogEntry, PatternDetector, AIAnalyzer
+import analyzer
+from analyzer import LogParser, LogEntry, PatternDetector, AIAnalyzer, analyze_file_parallel, parse_size, _iter_lines
 
 
 def test_log_parser_basic():
@@ -35,6 +33,20 @@ def test_log_parser_different_formats():
     assert entry3.level == "ERROR"
 
 
+
+def test_log_parser_ascii_levels():
+    """Test levels are ASCII words whichever regex backend is installed"""
+    parser = LogParser()
+
+    entry = parser._parse_line("ÉRROR: unicode")
+    assert entry.level == "INFO"
+    assert entry.message == "ÉRROR: unicode"
+
+    # Non-ASCII text in the message itself is kept
+    entry = parser._parse_line("2024-01-15 14:23:15 ERROR: café down")
+    assert entry.level == "ERROR"
+    assert entry.message == "café down"
+
 def test_pattern_detector():
     """Test pattern detection"""
     detector = PatternDetector()
@@ -98,3 +110,111 @@ def test_pattern_normalization():
 
     # Numbers should be normalized to 'N'
     assert msg1 == msg2
+
+
+def test_analyze_file_parallel_matches_serial(tmp_path):
+    """Test parallel analysis gives the same result as a serial pass"""
+    log_file = tmp_path / "app.log"
+    log_file.write_text(
+        "2024-01-15 14:23:15 ERROR: Connection refused to db 1\n"
+        "2024-01-15 14:23:16 INFO: Retrying\n"
+        "[ERROR] Timeout after 30s\n"
+        "WARNING: Slow query\n"
+        "2024-01-15 14:23:17 ERROR: Connection refused to db 2\n"
+    )
+
+    serial = PatternDetector().analyze(LogParser().parse_file(str(log_file)))
+    parallel = analyze_file_parallel(str(log_file), workers=3)
+
+    for key in ('total_entries', 'level_counts', 'error_count', 'top_errors', 'timeline'):
+        assert parallel[key] == serial[key]
+
+
+def test_log_parser_tail(tmp_path):
+    """Test tail parsing skips the partial first line"""
+    log_file = tmp_path / "app.log"
+    log_file.write_text(
+        "2024-01-15 14:23:15 INFO: Old message\n"
+        "2024-01-15 14:23:16 ERROR: Recent failure\n"
+    )
+
+    entries = list(LogParser().parse_tail(str(log_file), tail_bytes=50))
+
+    assert len(entries) == 1
+    assert entries[0].message == "Recent failure"
+
+
+def test_pattern_detector_cascades():
+    """Test cascades group errors that are close together in time"""
+    detector = PatternDetector()
+
+    entries = [
+        LogEntry("2024-01-15 14:00:00", "ERROR", "Connection failed", "raw"),
+        LogEntry("2024-01-15 14:00:02", "ERROR", "Connection failed", "raw"),
+        LogEntry("2024-01-15 14:00:04", "CRITICAL", "Service down", "raw"),
+        LogEntry("2024-01-15 14:10:00", "ERROR", "Timeout", "raw"),
+        LogEntry("2024-01-15 14:10:01", "ERROR", "Timeout", "raw"),
+    ]
+
+    cascades = detector.analyze(entries)['cascades']
+
+    assert cascades == [
+        {'count': 3, 'first': "2024-01-15 14:00:00", 'last': "2024-01-15 14:00:04"}
+    ]
+
+    # Syslog timestamps have no year, so Feb 29 must still parse
+    leap_day = [LogEntry(f"Feb 29 10:00:0{i}", "ERROR", "Disk full", "raw") for i in range(4)]
+    assert detector.analyze(leap_day)['cascades'] == [
+        {'count': 4, 'first': "Feb 29 10:00:00", 'last': "Feb 29 10:00:03"}
+    ]
+
+    # A backwards jump (year rollover) separates bursts rather than joining them
+    rollover = [
+        LogEntry("Dec 31 23:59:50", "ERROR", "Disk full", "raw"),
+        LogEntry("Dec 31 23:59:51", "ERROR", "Disk full", "raw"),
+        LogEntry("Jan 1 00:00:01", "ERROR", "Timeout", "raw"),
+        LogEntry("Jan 1 00:00:02", "ERROR", "Timeout", "raw"),
+    ]
+    assert detector.analyze(rollover)['cascades'] == []
+
+
+@pytest.mark.parametrize("mmap_threshold", [analyzer._MMAP_THRESHOLD, -1], ids=["read", "mmap"])
+@pytest.mark.parametrize("data", [
+    b"first line\nsecond line\nthird\n",
+    b"first line\nsecond line\nthird",
+    b"first line\r\nsecond line\r\nthird\r\n",
+])
+def test_iter_lines(tmp_path, monkeypatch, data, mmap_threshold):
+    """Test lines split across small chunks come back whole from both readers"""
+    monkeypatch.setattr(analyzer, '_MMAP_THRESHOLD', mmap_threshold)
+    log_file = tmp_path / "app.log"
+    log_file.write_bytes(data)
+
+    with open(log_file, 'rb') as f:
+        lines = list(_iter_lines(f, chunk_size=7))
+
+    assert lines == ["first line", "second line", "third"]
+
+
+def test_iter_lines_mmap_from_offset(tmp_path, monkeypatch):
+    """Test the memory-mapped reader starts at the file's current position"""
+    monkeypatch.setattr(analyzer, '_MMAP_THRESHOLD', -1)
+    log_file = tmp_path / "app.log"
+    log_file.write_bytes(b"skipped\nkept one\nkept two\n")
+
+    with open(log_file, 'rb') as f:
+        f.seek(len(b"skipped\n"))
+        lines = list(_iter_lines(f, chunk_size=7))
+
+    assert lines == ["kept one", "kept two"]
+
+
+def test_parse_size():
+    """Test size suffixes and rejection of bad sizes"""
+    assert parse_size("512") == 512
+    assert parse_size("4K") == 4096
+    assert parse_size("1.5mb") == 3 << 19
+
+    for bad in ("inf", "-inf", "nan", "abc", "0"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_size(bad)